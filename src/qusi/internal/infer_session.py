@@ -13,6 +13,7 @@ def infer_session(
         *,
         batch_size: int,
         device: Device,
+        workers_per_dataloader: int = 0,
 ) -> list[np.ndarray]:
     """
     Runs an infer session on finite datasets.
@@ -21,11 +22,23 @@ def infer_session(
     :param model: The model to perform the inference.
     :param batch_size: The batch size to use during inference.
     :param device: The device to run the model on.
+    :param workers_per_dataloader: The number of processes that are started to preprocess the data for each dataset.
+        When 0, the data is preprocessed in the main process.
     :return: A list of arrays with each element being the array predicted for each light curve in the dataset.
     """
+    if workers_per_dataloader == 0:
+        prefetch_factor = None
+    else:
+        prefetch_factor = 4
     infer_dataloaders: list[DataLoader] = []
     for infer_dataset in infer_datasets:
-        infer_dataloader = DataLoader(infer_dataset, batch_size=batch_size, pin_memory=True)
+        infer_dataloader = DataLoader(
+            infer_dataset,
+            batch_size=batch_size,
+            pin_memory=True,
+            prefetch_factor=prefetch_factor,
+            num_workers=workers_per_dataloader,
+        )
         infer_dataloaders.append(infer_dataloader)
     model.eval()
     results = []
@@ -12,7 +12,6 @@ from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
 import numpy as np
 import numpy.typing as npt
-import torch
 from filelock import FileLock
 from scipy import stats
 from scipy.interpolate import interp1d
@@ -32,7 +31,7 @@ from qusi.internal.light_curve_observation import (
 )
 from qusi.internal.light_curve_transforms import (
     from_light_curve_observation_to_fluxes_array_and_label_array,
-    pair_array_to_tensor, normalize_tensor_by_modified_z_score, make_uniform_length,
+    normalize_tensor_by_modified_z_score, make_uniform_length, array_to_tensor,
 )
 
 if TYPE_CHECKING:
@@ -325,7 +324,7 @@ def default_light_curve_observation_post_injection_transform(
         x = randomly_roll_light_curve_observation(x)
     x = from_light_curve_observation_to_fluxes_array_and_label_array(x)
     x = (make_uniform_length(x[0], length=length), x[1])  # Make the fluxes a uniform length.
-    x = pair_array_to_tensor(x)
+    x = (array_to_tensor(x[0]), array_to_tensor(x[1]))
     x = (normalize_tensor_by_modified_z_score(x[0]), x[1])
     return x
 
@@ -350,7 +349,7 @@ def default_light_curve_post_injection_transform(
         x = randomly_roll_light_curve(x)
     x = x.fluxes
     x = make_uniform_length(x, length=length)
-    x = torch.tensor(x, dtype=torch.float32)
+    x = array_to_tensor(x)
     x = normalize_tensor_by_modified_z_score(x)
     return x
 
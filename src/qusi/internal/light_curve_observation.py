@@ -16,6 +16,9 @@ class LightCurveObservation:
     :ivar label: The integer classification label.
     """
 
+    # Declared explicitly, rather than with `dataclass(slots=True)`, to remain compatible with Python 3.9.
+    __slots__ = ("light_curve", "label")
+
     light_curve: LightCurve
     label: int
 
@@ -36,6 +36,21 @@ def pair_array_to_tensor(
     )
 
 
+def array_to_tensor(array: npt.NDArray) -> Tensor:
+    """
+    Converts an array to a float32 tensor. If the array is already a writeable native float32 array, the tensor shares
+    its memory rather than copying it.
+
+    :param array: The array to convert.
+    :return: The tensor.
+    """
+    array = np.asarray(array, dtype=np.float32)
+    # Torch does not support negative strides, and a shared tensor would allow writes into a read-only array.
+    if any(stride < 0 for stride in array.strides) or not array.flags.writeable:
+        array = array.copy()
+    return torch.from_numpy(array)
+
+
 def randomly_roll_elements(example: np.ndarray) -> np.ndarray:
     """Randomly rolls the elements."""
     example = np.roll(example, np.random.randint(example.shape[0]), axis=0)
@@ -90,5 +105,5 @@ def remove_random_elements(array: np.ndarray, ratio: float = 0.01) -> np.ndarray
         values_to_remove = np.random.randint(max_values_to_remove)
     else:
         values_to_remove = 0
-    random_indexes = np.random.choice(range(light_curve_length), values_to_remove, replace=False)
+    random_indexes = np.random.choice(light_curve_length, values_to_remove, replace=False)
     return np.delete(array, random_indexes, axis=0)
\ No newline at end of file
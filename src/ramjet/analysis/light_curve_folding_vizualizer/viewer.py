@@ -36,14 +36,18 @@ class PeriodogramColumnName(StrEnum):
 class Viewer:
     def __init__(self, bokeh_document: Document, light_curve: LightCurve, title: str | None = None):
         self.bokeh_document: Document = bokeh_document
-        tool_tips = [
+        unfolded_tool_tips = [
+            ("Time", f"@{FoldedLightCurveColumnName.TIME}{{0.0000000}}"),
+            ("Flux", f"@{FoldedLightCurveColumnName.FLUX}{{0.0000000}}"),
+        ]
+        folded_tool_tips = [
             ("Time", f"@{FoldedLightCurveColumnName.TIME}{{0.0000000}}"),
             ("Folded time", f"@{FoldedLightCurveColumnName.FOLDED_TIME}{{0.0000000}}"),
             ("Flux", f"@{FoldedLightCurveColumnName.FLUX}{{0.0000000}}"),
         ]
-        self.folded_light_curve_figure: Figure = Figure(tooltips=tool_tips)
+        self.folded_light_curve_figure: Figure = Figure(tooltips=folded_tool_tips)
         self.folded_light_curve_figure.sizing_mode = "stretch_width"
-        self.unfolded_light_curve_figure: Figure = Figure(tooltips=tool_tips)
+        self.unfolded_light_curve_figure: Figure = Figure(tooltips=unfolded_tool_tips)
         self.unfolded_light_curve_figure.sizing_mode = "stretch_width"
         self.light_curve: LightCurve = light_curve
         flux_median = np.nanmedian(self.light_curve.fluxes)
@@ -63,16 +67,16 @@ class Viewer:
         mapper = LinearColorMapper(palette=Turbo256, low=minimum_time, high=maximum_time)
         color = {"field": FoldedLightCurveColumnName.TIME, "transform": mapper}
 
+        # The unfolded view plots the times directly, so it does not carry a duplicate folded time column.
         self.unfolded_light_curve_column_data_source: ColumnDataSource = ColumnDataSource(
             data={
                 FoldedLightCurveColumnName.TIME: self.light_curve.times,
-                FoldedLightCurveColumnName.FOLDED_TIME: self.light_curve.times,
                 FoldedLightCurveColumnName.FLUX: relative_fluxes,
             }
         )
         self.unfolded_light_curve_figure.circle(
             source=self.unfolded_light_curve_column_data_source,
-            x=FoldedLightCurveColumnName.FOLDED_TIME,
+            x=FoldedLightCurveColumnName.TIME,
             y=FoldedLightCurveColumnName.FLUX,
             line_color=color,
             line_alpha=0.8,
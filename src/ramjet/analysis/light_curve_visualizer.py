@@ -194,7 +194,7 @@ def add_folded_light_curve(figure, folded_times, fluxes, times):
     fluxes -= np.minimum(np.nanmin(fluxes), 0)
     flux_median = np.median(fluxes)
     relative_fluxes = fluxes / flux_median
-    mapper = LinearColorMapper(palette=Turbo256, low=min(times), high=max(times))
+    mapper = LinearColorMapper(palette=Turbo256, low=np.nanmin(times), high=np.nanmax(times))
     data_frame = pd.DataFrame({"folded_time": folded_times, "flux": relative_fluxes, "time": times})
     color = {"field": "time", "transform": mapper}
     figure.circle(
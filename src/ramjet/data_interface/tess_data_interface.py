@@ -332,10 +332,9 @@ def load_fluxes_and_times_from_fits_file(
         )
         raise ValueError(error_message)
     if remove_nans:
-        # noinspection PyUnresolvedReferences
-        nan_indexes = np.union1d(np.argwhere(np.isnan(fluxes)), np.argwhere(np.isnan(times)))
-        fluxes = np.delete(fluxes, nan_indexes)
-        times = np.delete(times, nan_indexes)
+        nan_indexes = np.isnan(fluxes) | np.isnan(times)
+        fluxes = fluxes[~nan_indexes]
+        times = times[~nan_indexes]
     return fluxes, times
 
 
@@ -360,13 +359,10 @@ def load_fluxes_flux_errors_and_times_from_fits_file(
         )
         raise ValueError(error_message)
     if remove_nans:
-        # noinspection PyUnresolvedReferences
-        nan_indexes = np.union1d(
-            np.argwhere(np.isnan(fluxes)), np.union1d(np.argwhere(np.isnan(times)), np.argwhere(np.isnan(flux_errors)))
-        )
-        fluxes = np.delete(fluxes, nan_indexes)
-        flux_errors = np.delete(flux_errors, nan_indexes)
-        times = np.delete(times, nan_indexes)
+        nan_indexes = np.isnan(fluxes) | np.isnan(times) | np.isnan(flux_errors)
+        fluxes = fluxes[~nan_indexes]
+        flux_errors = flux_errors[~nan_indexes]
+        times = times[~nan_indexes]
     return fluxes, flux_errors, times
 
 
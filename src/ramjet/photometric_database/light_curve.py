@@ -166,7 +166,10 @@ class LightCurve:
         )
 
     def fold(self, period: float, epoch: float) -> None:
-        self.folded_times = (self.times - epoch) % period
+        # The modulo is applied in-place on the offset times, which saves one temporary array.
+        folded_times = np.subtract(self.times, epoch, dtype=np.result_type(self.times, epoch, period))
+        np.mod(folded_times, period, out=folded_times)
+        self.folded_times = folded_times
 
 
 class MissingFoldedTimesError(Exception):
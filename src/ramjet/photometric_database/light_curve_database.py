@@ -22,10 +22,19 @@ def preprocess_times(light_curve_array: np.ndarray) -> None:
 def make_times_and_fluxes_array_uniform_length(
     arrays: tuple[npt.NDArray[np.float32], npt.NDArray[np.float32]], length: int, *, randomize: bool = True
 ) -> (np.ndarray, np.ndarray):
+    """
+    Makes the times and fluxes a specific length, applying the same clipping, repeating, and random roll to both.
+
+    :param arrays: The times and fluxes arrays.
+    :param length: The length to make the arrays.
+    :param randomize: Whether to randomly roll the arrays.
+    :return: The uniform length times and fluxes. Each array keeps its own dtype.
+    """
     times, fluxes = arrays
-    light_curve_array = np.stack([times, fluxes], axis=-1)
-    uniform_length_light_curve_array = make_uniform_length(light_curve_array, length=length, randomize=randomize)
-    return uniform_length_light_curve_array[:, 0], uniform_length_light_curve_array[:, 1]
+    # Make the index order uniform length once and gather both arrays with it, rather than stacking the arrays
+    # together only to split them apart again.
+    uniform_length_indexes = make_uniform_length(np.arange(times.shape[0]), length=length, randomize=randomize)
+    return times[uniform_length_indexes], fluxes[uniform_length_indexes]
 
 
 def make_fluxes_and_label_array_uniform_length(
@@ -220,7 +229,7 @@ def remove_random_elements(light_curve: np.ndarray, ratio: float = 0.01) -> np.n
         values_to_remove = np.random.randint(max_values_to_remove)
     else:
         values_to_remove = 0
-    random_indexes = np.random.choice(range(light_curve_length), values_to_remove, replace=False)
+    random_indexes = np.random.choice(light_curve_length, values_to_remove, replace=False)
     return np.delete(light_curve, random_indexes, axis=0)
 
 
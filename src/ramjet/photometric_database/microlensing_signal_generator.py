@@ -87,7 +87,7 @@ class MagnificationSignal:
         u0_list = np.linspace(-0.1, 0, 1000)
         self.u0 = np.random.choice(u0_list)
 
-        index = np.random.choice(np.arange(self.einstein_crossing_time_list.shape[0]))
+        index = np.random.randint(self.einstein_crossing_time_list.shape[0])
         self.tE = float(self.einstein_crossing_time_list[index])
         self.rho = float(self.rho_list[index])
 
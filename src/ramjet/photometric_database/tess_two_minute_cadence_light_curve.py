@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Any
 
 import numpy as np
+import pandas as pd
 from astropy.io import fits
 
 from ramjet.data_interface.tess_data_interface import download_two_minute_cadence_light_curve
@@ -68,13 +69,15 @@ class TessMissionLightCurve(TessLightCurve):
         light_curve.time_column_name = TessMissionLightCurveColumnName.TIME__BTJD.value
         if fits_indexes_to_load is None:
             fits_indexes_to_load = list(TessMissionLightCurveFitsIndex)
+        columns: dict[str, np.ndarray] = {}
         with fits.open(path) as hdu_list:
             light_curve_table = hdu_list[1].data  # Light curve information is in first extension table.
             for fits_index in fits_indexes_to_load:
                 column_name = TessMissionLightCurveColumnName[fits_index.name]
                 column = light_curve_table[fits_index.value]
-                column = ensure_native_byte_order(column)
-                light_curve.data_frame[column_name.value] = column
+                columns[column_name.value] = ensure_native_byte_order(column)
+            # Build the data frame in a single construction, rather than inserting column by column.
+            light_curve.data_frame = pd.DataFrame(columns)
         light_curve.tic_id, light_curve.sector = cls.get_tic_id_and_sector_from_file_path(path)
         return light_curve
 
@@ -167,7 +170,14 @@ class TessTwoMinuteCadenceLightCurve(TessMissionLightCurve):
 
 
 def ensure_native_byte_order(array: np.ndarray) -> np.ndarray:
+    """
+    Converts an array to the native byte order, if it is not already. The conversion is performed as a single cast
+    to the native order dtype, which swaps and copies the data in one pass.
+
+    :param array: The array to convert.
+    :return: The array in native byte order.
+    """
     native_byte_order = ">" if sys.byteorder == "big" else "<"
     if array.dtype.byteorder in ["|", "=", native_byte_order]:
         return array
-    return array.byteswap().newbyteorder(native_byte_order)
+    return array.astype(array.dtype.newbyteorder(native_byte_order))
@@ -24,3 +24,16 @@ def test_toy_infer_session():
                                 batch_size=100, device=device)[0]
     assert isinstance(confidences, np.ndarray)
     assert 0 <= confidences[0] <= 1
+
+
+def test_toy_infer_session_with_preprocessing_workers():
+    os.environ["WANDB_MODE"] = "disabled"
+    model = SingleDenseLayerBinaryClassificationModel.new(input_size=100)
+    test_light_curve_dataset = get_toy_finite_light_curve_dataset()
+    test_light_curve_dataset.post_injection_transform = partial(
+        default_light_curve_post_injection_transform, length=100
+    )
+    device = get_device()
+    confidences = infer_session(infer_datasets=[test_light_curve_dataset], model=model,
+                                batch_size=100, device=device, workers_per_dataloader=2)[0]
+    assert confidences.shape[0] == len(test_light_curve_dataset)
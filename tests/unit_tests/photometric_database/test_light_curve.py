@@ -79,3 +79,16 @@ class TestLightCurve:
         light_curve_values = light_curve.data_frame["a"].values
         expected_values = np.array([0.5, 1, 1.5, np.nan])
         assert np.allclose(light_curve_values, expected_values, equal_nan=True)
+
+    def test_fold_sets_folded_times_relative_to_epoch(self):
+        light_curve = LightCurve()
+        light_curve.times = np.array([1.0, 2.0, 3.5, 5.0])
+        light_curve.fold(period=2.0, epoch=0.5)
+        assert np.allclose(light_curve.folded_times, [0.5, 1.5, 1.0, 0.5])
+        assert np.array_equal(light_curve.times, [1.0, 2.0, 3.5, 5.0])
+
+    def test_fold_promotes_integer_times_when_period_is_a_float(self):
+        light_curve = LightCurve()
+        light_curve.times = np.array([1, 2, 3, 5])
+        light_curve.fold(period=2.5, epoch=0)
+        assert np.allclose(light_curve.folded_times, [1, 2, 0.5, 0])
@@ -185,6 +185,18 @@ class TestLightCurveDatabase:
         uniform_length_fluxes = module.make_uniform_length(fluxes, 3, randomize=False)
         assert np.array_equal(uniform_length_fluxes, [[0, 0], [1, -1], [0, 0]])
 
+    def test_make_times_and_fluxes_array_uniform_length_keeps_times_and_fluxes_paired(self):
+        times = np.array([0, 1, 2, 3], dtype=np.float64)
+        fluxes = np.array([0, -1, -2, -3], dtype=np.float32)
+        with patch.object(module.np.random, "randint") as stub_randint:
+            stub_randint.return_value = 3
+            uniform_length_times, uniform_length_fluxes = module.make_times_and_fluxes_array_uniform_length(
+                (times, fluxes), 6
+            )
+        assert np.array_equal(uniform_length_times, [1, 2, 3, 0, 1, 2])
+        assert np.array_equal(uniform_length_fluxes, [-1, -2, -3, 0, -1, -2])
+        assert uniform_length_fluxes.dtype == np.float32
+
     def test_remove_random_elements_removes_elements(self):
         array = np.array([0, 1, 2, 3])
         with patch.object(module.np.random, "randint") as mock_randint:
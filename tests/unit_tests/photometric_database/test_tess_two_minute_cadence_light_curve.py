@@ -16,23 +16,17 @@ from ramjet.photometric_database.tess_two_minute_cadence_light_curve import (
 class TestTessTwoMinuteCadenceFileBasedLightCurve:
     @pytest.fixture
     def fake_hdu_list(self):
-        mock_hdu_data = {
-            TessMissionLightCurveFitsIndex.TIME__BTJD.value: np.array(
-                [0, 1], dtype=np.float32
-            ),
-            TessMissionLightCurveFitsIndex.PDCSAP_FLUX.value: np.array(
-                [2, 3], dtype=np.float32
-            ),
-            TessMissionLightCurveFitsIndex.SAP_FLUX.value: np.array(
-                [4, 5], dtype=np.float32
-            ),
-            TessMissionLightCurveFitsIndex.PDCSAP_FLUX_ERROR.value: np.array(
-                [6, 7], dtype=np.float32
-            ),
-            TessMissionLightCurveFitsIndex.SAP_FLUX_ERROR.value: np.array(
-                [8, 9], dtype=np.float32
-            ),
-        }
+        # Mirror a MAST FITS table, which is a big-endian structured record array rather than separate arrays.
+        mock_hdu_data = np.rec.array(
+            [(0, 2, 4, 6, 8), (1, 3, 5, 7, 9)],
+            dtype=[
+                (TessMissionLightCurveFitsIndex.TIME__BTJD.value, ">f8"),
+                (TessMissionLightCurveFitsIndex.PDCSAP_FLUX.value, ">f4"),
+                (TessMissionLightCurveFitsIndex.SAP_FLUX.value, ">f4"),
+                (TessMissionLightCurveFitsIndex.PDCSAP_FLUX_ERROR.value, ">f4"),
+                (TessMissionLightCurveFitsIndex.SAP_FLUX_ERROR.value, ">f4"),
+            ],
+        )
         mock_hdu = Mock()
         mock_hdu.data = mock_hdu_data
         mock_hdu_list = [
@@ -69,6 +63,13 @@ class TestTessTwoMinuteCadenceFileBasedLightCurve:
                     expected_data_frame[fits_index.value],
                 )
 
+    def test_from_path_factory_converts_fits_columns_to_native_byte_order(self, fake_hdu_list):
+        with patch.object(module.fits, "open") as mock_open:
+            mock_open.return_value.__enter__.return_value = fake_hdu_list
+            light_curve = TessMissionLightCurve.from_path(Path("TIC 169480782 sector 5.fits"))
+            for column_name in TessMissionLightCurveColumnName:
+                assert light_curve.data_frame[column_name.value].to_numpy().dtype.isnative
+
     def test_from_path_factory_light_curve_uses_correct_default_times_and_fluxes(
         self, fake_hdu_list
     ):
@@ -146,3 +147,10 @@ class TestTessTwoMinuteCadenceFileBasedLightCurve:
         assert mock_download.call_args[1]["sector"] == 2
         assert mock_from_path.call_args[1]["path"] == mock_light_curve_path
         assert light_curve is mock_light_curve
+
+    def test_ensure_native_byte_order_converts_non_native_arrays_without_changing_values(self):
+        array = np.array([0, 1.5, 2], dtype=np.dtype(np.float32).newbyteorder("S"))
+        assert not array.dtype.isnative
+        native_array = module.ensure_native_byte_order(array)
+        assert native_array.dtype.isnative
+        assert np.array_equal(native_array, [0, 1.5, 2])
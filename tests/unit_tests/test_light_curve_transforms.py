@@ -0,0 +1,40 @@
+import numpy as np
+import torch
+
+from qusi.internal.light_curve_transforms import array_to_tensor, pair_array_to_tensor
+
+
+def test_array_to_tensor_shares_memory_with_float32_array():
+    array = np.array([0, 1, 2], dtype=np.float32)
+    tensor = array_to_tensor(array)
+    assert tensor.dtype == torch.float32
+    assert np.shares_memory(tensor.numpy(), array)
+
+
+def test_array_to_tensor_converts_other_dtypes():
+    tensor = array_to_tensor(np.array([0, 1, 2], dtype=np.float64))
+    assert tensor.dtype == torch.float32
+    assert torch.equal(tensor, torch.tensor([0, 1, 2], dtype=torch.float32))
+
+
+def test_array_to_tensor_copies_float32_arrays_with_negative_strides():
+    array = np.arange(3, dtype=np.float32)[::-1]
+    tensor = array_to_tensor(array)
+    assert torch.equal(tensor, torch.tensor([2, 1, 0], dtype=torch.float32))
+    assert not np.shares_memory(tensor.numpy(), array)
+
+
+def test_array_to_tensor_copies_read_only_arrays():
+    array = np.array([0, 1, 2], dtype=np.float32)
+    array.flags.writeable = False
+    tensor = array_to_tensor(array)
+    tensor[0] = 5
+    assert np.array_equal(array, [0, 1, 2])
+
+
+def test_pair_array_to_tensor_copies_arrays_and_keeps_scalar_label_shape():
+    fluxes = np.array([0, 1], dtype=np.float32)
+    fluxes_tensor, label_tensor = pair_array_to_tensor((fluxes, np.array(1, dtype=np.float32)))
+    assert fluxes_tensor.shape == (2,)
+    assert label_tensor.shape == ()
+    assert not np.shares_memory(fluxes_tensor.numpy(), fluxes)